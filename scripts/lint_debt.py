@@ -15,7 +15,10 @@ Allowed formats (must be uppercase):
 
 Enforcement:
 - Scans all `*.py` files (excluding common cache/venv/build dirs).
-- Extracts COMMENT tokens using `tokenize`.
+- Skips files whose raw bytes contain no marker word at all; the rest have
+  their COMMENT tokens extracted using `tokenize`. Because of that prefilter,
+  a marker-free file that cannot be tokenized (e.g. an unterminated string)
+  is not reported here; syntax errors are left to the py-compile hook.
 - If a marker appears, it must match the allowed format and reference an
   existing, non-closed ticket file.
 - Also verifies that docs/ARCHITECTURE.md contains the "Technical Debt" section.
@@ -23,12 +26,15 @@ Enforcement:
 
 from __future__ import annotations
 
+import functools
+import os
 import re
 import tokenize
 from dataclasses import dataclass
 from pathlib import Path
 
 _MARKER_RE = re.compile(r"\b(TODO|FIXME|HACK|XXX|DEBT)\b")
+_MARKER_BYTES_RE = re.compile(rb"\b(?:TODO|FIXME|HACK|XXX|DEBT)\b")
 _VALID_RE = re.compile(
     r"(?P<marker>TODO|FIXME|HACK|XXX|DEBT)\((?P<ticket>[a-z]+-[0-9a-f]{4})\):\s+\S"
 )
@@ -53,6 +59,7 @@ class Violation:
     message: str
 
 
+@functools.cache
 def _ticket_status(ticket_id: str) -> str | None:
     path = Path(".tickets") / f"{ticket_id}.md"
     if not path.exists():
@@ -76,6 +83,11 @@ def _check_debt_in_python_file(path: Path) -> list[Violation]:
     violations: list[Violation] = []
 
     try:
+        # Markers are ASCII, so a bytes search is a safe prefilter; only files
+        # that mention one somewhere pay for a full tokenize pass.
+        if not _MARKER_BYTES_RE.search(path.read_bytes()):
+            return violations
+
         with tokenize.open(path) as f:
             tokens = tokenize.generate_tokens(f.readline)
             for tok_type, tok_str, (line_no, _), _, _ in tokens:
@@ -88,8 +100,7 @@ def _check_debt_in_python_file(path: Path) -> list[Violation]:
                     continue
 
                 for marker_match in _MARKER_RE.finditer(comment):
-                    start = marker_match.start()
-                    valid = _VALID_RE.match(comment[start:])
+                    valid = _VALID_RE.match(comment, marker_match.start())
                     if not valid:
                         violations.append(
                             Violation(
@@ -159,13 +170,20 @@ def _check_architecture_doc() -> list[Violation]:
     ]
 
 
+def _iter_python_files(root: Path) -> list[Path]:
+    """Return `*.py` files under `root`, never descending into skipped dirs."""
+    paths: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name not in _SKIP_DIRS]
+        paths.extend(Path(dirpath, name) for name in filenames if name.endswith(".py"))
+    return sorted(paths)
+
+
 def check(directory: str = ".") -> list[Violation]:
     root = Path(directory)
     violations: list[Violation] = []
 
-    for path in sorted(root.rglob("*.py")):
-        if any(part in _SKIP_DIRS for part in path.parts):
-            continue
+    for path in _iter_python_files(root):
         violations.extend(_check_debt_in_python_file(path))
 
     violations.extend(_check_architecture_doc())
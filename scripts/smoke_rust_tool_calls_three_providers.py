@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 """Smoke test: 3 sequential tool-call turns via the optional binding across 3 providers.
 
+Providers run concurrently; each one's output is buffered and printed as a block.
+
 Install/build `tinyagent._alchemy` from:
   https://github.com/tunahorse/tinyagent-alchemy
 """
 
 from __future__ import annotations
 
+import asyncio
+import io
 import json
 import os
 from typing import Any
@@ -103,10 +107,10 @@ def execute_tool(name: str, arguments: dict[str, Any]) -> str:
     return str(result)
 
 
-def normalize_args(raw: Any) -> dict[str, Any]:
+def normalize_args(raw: Any, out: io.StringIO) -> dict[str, Any]:
     """Ensure arguments are a dict, parsing from string if needed."""
     if isinstance(raw, str):
-        print(f"      !! WARNING: arguments is str, not dict: {raw!r}")
+        print(f"      !! WARNING: arguments is str, not dict: {raw!r}", file=out)
         parsed = json.loads(raw) if raw else {}
         return parsed if isinstance(parsed, dict) else {}
     if isinstance(raw, dict):
@@ -124,26 +128,26 @@ def do_turn(model: dict[str, Any], api_key: str, messages: list[dict[str, Any]])
     options: dict[str, Any] = {"api_key": api_key}
 
     handle = openai_completions_stream(model, context, options)
-    while handle.next_event() is not None:
-        pass
+    # Events are buffered in an unbounded channel, so waiting on the final
+    # result directly avoids one Python/Rust round trip per stream event.
     result: dict[str, Any] = handle.result()
     return result
 
 
-def run_provider(label: str, model: dict[str, Any], api_key: str) -> None:
-    print(f"\n{'=' * 60}")
-    print(f"  PROVIDER: {label}")
-    print(f"  model:    {model['id']}")
-    print(f"  api:      {model['api']}")
-    print(f"{'=' * 60}")
+async def run_provider(label: str, model: dict[str, Any], api_key: str, out: io.StringIO) -> None:
+    print(f"\n{'=' * 60}", file=out)
+    print(f"  PROVIDER: {label}", file=out)
+    print(f"  model:    {model['id']}", file=out)
+    print(f"  api:      {model['api']}", file=out)
+    print(f"{'=' * 60}", file=out)
 
     messages: list[dict[str, Any]] = [
         {"role": "user", "content": [{"type": "text", "text": PROMPT}]}
     ]
 
     for turn in range(1, 4):
-        print(f"\n  --- Turn {turn} ---")
-        result = do_turn(model, api_key, messages)
+        print(f"\n  --- Turn {turn} ---", file=out)
+        result = await asyncio.to_thread(do_turn, model, api_key, messages)
 
         stop_reason = result.get("stop_reason")
         content: list[dict[str, Any]] = result.get("content", [])
@@ -151,30 +155,30 @@ def run_provider(label: str, model: dict[str, Any], api_key: str) -> None:
         text_blocks = [c.get("text", "") for c in content if c.get("type") == "text"]
         text = " ".join(t for t in text_blocks if t).strip()
 
-        print(f"  stop_reason: {stop_reason}")
+        print(f"  stop_reason: {stop_reason}", file=out)
 
         if text:
-            print(f"  text:        {text[:200]}")
+            print(f"  text:        {text[:200]}", file=out)
 
         if not tool_calls:
-            print("  (no tool calls)")
+            print("  (no tool calls)", file=out)
             if turn < 3:
-                print(f"  !! Model stopped early at turn {turn}")
+                print(f"  !! Model stopped early at turn {turn}", file=out)
             break
 
         tc = tool_calls[0]
         name: str = tc.get("name", "?")
-        args = normalize_args(tc.get("arguments", {}))
+        args = normalize_args(tc.get("arguments", {}), out)
         args_type = type(args).__name__
         tc_id: str = tc.get("id", "")
 
-        print(f"  tool:        {name}")
-        print(f"  args:        {args}")
-        print(f"  args type:   {args_type}")
-        print(f"  tool_id:     {tc_id}")
+        print(f"  tool:        {name}", file=out)
+        print(f"  args:        {args}", file=out)
+        print(f"  args type:   {args_type}", file=out)
+        print(f"  tool_id:     {tc_id}", file=out)
 
         tool_result = execute_tool(name, args)
-        print(f"  result:      {tool_result}")
+        print(f"  result:      {tool_result}", file=out)
 
         # Append assistant + tool_result to messages for next turn
         messages.append({"role": "assistant", "content": content, "stop_reason": stop_reason})
@@ -188,28 +192,40 @@ def run_provider(label: str, model: dict[str, Any], api_key: str) -> None:
         )
     else:
         # After 3 tool turns, get final answer
-        print("\n  --- Final turn ---")
-        result = do_turn(model, api_key, messages)
+        print("\n  --- Final turn ---", file=out)
+        result = await asyncio.to_thread(do_turn, model, api_key, messages)
         content = result.get("content", [])
         text_blocks = [c.get("text", "") for c in content if c.get("type") == "text"]
         text = " ".join(t for t in text_blocks if t).strip()
-        print(f"  stop_reason: {result.get('stop_reason')}")
-        print(f"  answer:      {text[:200]}")
+        print(f"  stop_reason: {result.get('stop_reason')}", file=out)
+        print(f"  answer:      {text[:200]}", file=out)
+
+    print("\n  RESULT: PASS", file=out)
 
-    print("\n  RESULT: PASS")
 
+async def run_provider_buffered(provider: dict[str, Any]) -> str:
+    """Run one provider and return its output as a single block."""
+    out = io.StringIO()
+    label: str = provider["label"]
+    try:
+        await run_provider(label, provider["model"], provider["api_key"], out)
+    except Exception as e:
+        print(f"\n  FAILED {label}: {e}", file=out)
+    return out.getvalue()
 
-def main() -> None:
+
+async def main() -> None:
+    runnable: list[dict[str, Any]] = []
     for p in PROVIDERS:
-        api_key: str = p["api_key"]
-        if not api_key:
+        if not p["api_key"]:
             print(f"\nSKIPPED {p['label']}: no API key")
             continue
-        try:
-            run_provider(p["label"], p["model"], api_key)
-        except Exception as e:
-            print(f"\n  FAILED {p['label']}: {e}")
+        runnable.append(p)
+
+    outputs = await asyncio.gather(*(run_provider_buffered(p) for p in runnable))
+    for output in outputs:
+        print(output, end="")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -9,12 +9,14 @@ import pytest
 from tinyagent.agent_types import (
     AgentEndEvent,
     AgentEvent,
+    AgentLoopConfig,
     AgentMessage,
     AgentStartEvent,
     EventStream,
     MessageEndEvent,
     MessageStartEvent,
     MessageUpdateEvent,
+    Model,
     TextContent,
     ToolExecutionEndEvent,
     ToolExecutionStartEvent,
@@ -30,6 +32,7 @@ from tinyagent.agent_types import (
     is_tool_execution_event,
     is_tool_execution_start_event,
     is_turn_end_event,
+    validate_max_parallel_tools,
 )
 
 
@@ -163,3 +166,19 @@ async def test_event_stream_result_from_agent_end_event() -> None:
     stream.push(AgentEndEvent(messages=expected_messages))
 
     assert await stream.result() == expected_messages
+
+
+@pytest.mark.parametrize(
+    ("limit", "error"),
+    [(0, ValueError), (-1, ValueError), (True, TypeError), (1.5, TypeError)],
+)
+def test_validate_max_parallel_tools_rejects_invalid_limits(
+    limit: object, error: type[Exception]
+) -> None:
+    with pytest.raises(error, match="max_parallel_tools"):
+        validate_max_parallel_tools(limit)  # type: ignore[arg-type]
+
+
+def test_agent_loop_config_validates_max_parallel_tools() -> None:
+    with pytest.raises(ValueError, match="max_parallel_tools"):
+        AgentLoopConfig(model=Model(), convert_to_llm=lambda m: [], max_parallel_tools=0)
@@ -111,6 +111,43 @@ class TestParallelToolExecution:
         assert result.steering_messages is None
 
 
+class TestBoundedParallelism:
+    """max_parallel_tools caps how many tools run at once."""
+
+    async def test_limit_caps_in_flight_tools(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def execute(
+            tool_call_id: str,
+            args: JsonObject,
+            signal: asyncio.Event | None,
+            on_update: Callable[[AgentToolResult], None],
+        ) -> AgentToolResult:
+            del tool_call_id, args, signal, on_update
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return AgentToolResult(content=[TextContent(text="ok")])
+
+        tool = AgentTool(name="work", description="work", execute=execute)
+        message = _make_message(*(["work"] * 5))
+        stream = _make_stream()
+
+        result = await execute_tool_calls([tool], message, None, stream, max_parallel_tools=2)
+
+        assert peak == 2
+        assert [r.tool_call_id for r in result.tool_results] == [f"tc_{i}" for i in range(5)]
+
+    async def test_invalid_limit_raises_even_without_tool_calls(self) -> None:
+        message = AssistantMessage(content=[TextContent(text="no tools")])
+        stream = _make_stream()
+        with pytest.raises(ValueError, match="max_parallel_tools"):
+            await execute_tool_calls([], message, None, stream, max_parallel_tools=0)
+
+
 class TestParallelEventOrdering:
     """Events are emitted in correct order for parallel execution."""
 
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from typing import cast
 
+import httpx
 import pytest
 
-from tinyagent.agent_types import Context, Message, TextContent, UserMessage
-from tinyagent.proxy import _context_to_json, _message_to_json
+from tinyagent.agent_types import Context, Message, Model, TextContent, UserMessage
+from tinyagent.proxy import ProxyStreamOptions, _context_to_json, _message_to_json, stream_proxy
 
 
 def test_message_to_json_rejects_value_without_model_dump() -> None:
@@ -43,3 +44,25 @@ def test_context_to_json_accepts_model_messages() -> None:
     payload = _context_to_json(context)
     assert payload["system_prompt"] == "test"
     assert isinstance(payload["messages"], list)
+
+
+async def test_stream_proxy_reuses_caller_owned_client() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text='data: {"type": "done", "reason": "stop"}\n\n')
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        options = ProxyStreamOptions(
+            auth_token="token", proxy_url="https://proxy.test", client=client
+        )
+        for _ in range(2):
+            response = await stream_proxy(Model(id="m"), Context(), options)
+            message = await response.result()
+            assert message.stop_reason == "stop"
+
+        assert not client.is_closed
+
+    assert [str(r.url) for r in requests] == ["https://proxy.test/api/stream"] * 2
+    assert requests[0].headers["Authorization"] == "Bearer token"
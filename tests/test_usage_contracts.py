@@ -418,6 +418,7 @@ def test_agent_does_not_continue_turn_when_tool_execution_returns_no_results(
             get_steering_messages: AgentMessageProvider | None = None,
             before_tool_call: object = None,
             after_tool_call: object = None,
+            max_parallel_tools: int | None = None,
         ) -> ToolExecutionResult:
             del (
                 tools,
@@ -427,6 +428,7 @@ def test_agent_does_not_continue_turn_when_tool_execution_returns_no_results(
                 get_steering_messages,
                 before_tool_call,
                 after_tool_call,
+                max_parallel_tools,
             )
             return ToolExecutionResult()
 
@@ -486,6 +488,89 @@ def test_agent_does_not_continue_turn_when_tool_execution_returns_no_results(
     _run(_scenario())
 
 
+def test_agent_options_max_parallel_tools_reaches_execute_tool_calls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _scenario() -> None:
+        received_limits: list[int | None] = []
+
+        async def fake_execute_tool_calls(
+            tools: list[AgentTool] | None,
+            assistant_message: AssistantMessage,
+            signal: asyncio.Event | None,
+            stream: object,
+            get_steering_messages: AgentMessageProvider | None = None,
+            before_tool_call: object = None,
+            after_tool_call: object = None,
+            max_parallel_tools: int | None = None,
+        ) -> ToolExecutionResult:
+            del (
+                tools,
+                assistant_message,
+                signal,
+                stream,
+                get_steering_messages,
+                before_tool_call,
+                after_tool_call,
+            )
+            received_limits.append(max_parallel_tools)
+            return ToolExecutionResult()
+
+        agent_loop_module = importlib.import_module("tinyagent.agent_loop")
+        monkeypatch.setattr(agent_loop_module, "execute_tool_calls", fake_execute_tool_calls)
+
+        tool_call_message = AssistantMessage(
+            content=[ToolCallContent(id="call_1", name="echo", arguments={})],
+            stop_reason="tool_calls",
+            usage=_usage_payload(),
+        )
+
+        async def fake_stream_fn(
+            model: Model,
+            context: Context,
+            options: SimpleStreamOptions,
+        ) -> FakeStreamResponse:
+            events = [
+                AssistantMessageEvent(type="done", reason="tool_calls", message=tool_call_message)
+            ]
+            return FakeStreamResponse(events, tool_call_message)
+
+        agent = Agent(AgentOptions(stream_fn=fake_stream_fn, max_parallel_tools=3))
+        agent.set_model(Model(provider="openrouter", id="m", api="openai-completions"))
+
+        await agent.prompt("hello")
+
+        assert received_limits == [3]
+
+    _run(_scenario())
+
+
+def test_agent_rejects_invalid_max_parallel_tools_before_streaming() -> None:
+    async def _scenario() -> None:
+        stream_calls = 0
+
+        async def fake_stream_fn(
+            model: Model,
+            context: Context,
+            options: SimpleStreamOptions,
+        ) -> FakeStreamResponse:
+            nonlocal stream_calls
+            stream_calls += 1
+            raise AssertionError("stream_fn must not be called")
+
+        agent = Agent(AgentOptions(stream_fn=fake_stream_fn, max_parallel_tools=0))
+        agent.set_model(Model(provider="openrouter", id="m", api="openai-completions"))
+
+        with pytest.raises(ValueError, match="max_parallel_tools"):
+            await agent.prompt("hello")
+
+        assert stream_calls == 0
+        assert agent.state.messages == []
+        assert agent.state.is_streaming is False
+
+    _run(_scenario())
+
+
 def test_agent_stops_cleanly_when_tool_result_requests_termination() -> None:
     async def _scenario() -> None:
         stream_call_count = 0
@@ -716,8 +801,17 @@ def test_process_turn_does_not_double_poll_steering_after_tool_batch(
             get_steering_messages_cb: AgentMessageProvider | None = None,
             before_tool_call: object = None,
             after_tool_call: object = None,
+            max_parallel_tools: int | None = None,
         ) -> ToolExecutionResult:
-            del tools, assistant_message, signal, stream, before_tool_call, after_tool_call
+            del (
+                tools,
+                assistant_message,
+                signal,
+                stream,
+                before_tool_call,
+                after_tool_call,
+                max_parallel_tools,
+            )
             assert get_steering_messages_cb is not None
             await get_steering_messages_cb()
             return ToolExecutionResult(
@@ -57,6 +57,7 @@ from .agent_types import (
     TurnEndEvent,
     TurnStartEvent,
     UserMessage,
+    validate_max_parallel_tools,
 )
 from .proxy import ProxyStreamOptions, ProxyStreamResponse, create_proxy_stream, stream_proxy
 from .proxy_event_handlers import parse_streaming_json
@@ -112,6 +113,7 @@ __all__ = [
     "ToolExecutionEndEvent",
     "AgentEvent",
     "AgentLoopConfig",
+    "validate_max_parallel_tools",
     "AgentState",
     "EventStream",
     "StreamFn",
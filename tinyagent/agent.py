@@ -273,6 +273,7 @@ class AgentOptions:
     before_tool_call: BeforeToolCallFn | None = None
     after_tool_call: AfterToolCallFn | None = None
     should_stop_after_turn: ShouldStopAfterTurnFn | None = None
+    max_parallel_tools: int | None = None
 
 
 class Agent:
@@ -304,6 +305,7 @@ class Agent:
         self._before_tool_call = opts.before_tool_call
         self._after_tool_call = opts.after_tool_call
         self._should_stop_after_turn = opts.should_stop_after_turn
+        self._max_parallel_tools = opts.max_parallel_tools
 
     @property
     def session_id(self) -> str | None:
@@ -488,8 +490,8 @@ class Agent:
 
             msgs = self._build_input_messages(input_data, images)
 
-            self._setup_run_state()
             context, config = self._build_loop_context_and_config(model)
+            self._setup_run_state()
             partial_holder: list[AgentMessage | None] = [None]
 
             try:
@@ -579,9 +581,10 @@ class Agent:
         if not model:
             raise RuntimeError("No model configured")
 
-        self._setup_run_state()
-
+        # Build the config first so invalid options raise before run state is set.
         context, config = self._build_loop_context_and_config(model)
+
+        self._setup_run_state()
         partial_holder: list[AgentMessage | None] = [None]
 
         try:
@@ -632,6 +635,7 @@ class Agent:
             before_tool_call=self._before_tool_call,
             after_tool_call=self._after_tool_call,
             should_stop_after_turn=self._should_stop_after_turn,
+            max_parallel_tools=self._max_parallel_tools,
         )
 
         return context, config
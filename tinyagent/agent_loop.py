@@ -316,6 +316,7 @@ async def _process_turn(
         config.get_steering_messages,
         config.before_tool_call,
         config.after_tool_call,
+        max_parallel_tools=config.max_parallel_tools,
     )
     tool_results = tool_execution.tool_results
     has_more_tool_calls = len(tool_results) > 0
@@ -28,6 +28,7 @@ from .agent_types import (
     ToolExecutionUpdateEvent,
     ToolLoopControl,
     ToolResultMessage,
+    validate_max_parallel_tools,
 )
 
 T = TypeVar("T")
@@ -74,11 +75,9 @@ def validate_tool_arguments(tool: AgentTool, tool_call: ToolCallContent) -> Json
 
 
 def _extract_tool_calls(assistant_message: AssistantMessage) -> list[ToolCallContent]:
-    tool_calls: list[ToolCallContent] = []
-    for content in assistant_message.content:
-        if isinstance(content, ToolCallContent):
-            tool_calls.append(content)
-    return tool_calls
+    return [
+        content for content in assistant_message.content if isinstance(content, ToolCallContent)
+    ]
 
 
 def _find_tool(tools: list[AgentTool] | None, name: str) -> AgentTool | None:
@@ -259,6 +258,32 @@ async def _apply_after_tool_call(
     return final_result, tool_result_message.is_error, final_terminate, tool_result_message
 
 
+def _resolve_parallel_limit(max_parallel_tools: int | None) -> asyncio.Semaphore | None:
+    validate_max_parallel_tools(max_parallel_tools)
+    if max_parallel_tools is None:
+        return None
+    return asyncio.Semaphore(max_parallel_tools)
+
+
+async def _execute_single_tool_bounded(
+    limit: asyncio.Semaphore | None,
+    tool: AgentTool | None,
+    tool_call: ToolCallContent,
+    signal: asyncio.Event | None,
+    stream: EventStream,
+    parent_task: asyncio.Task[object] | None,
+    before_tool_call: BeforeToolCallFn | None,
+) -> tuple[AgentToolResult, bool, bool]:
+    if limit is None:
+        return await _execute_single_tool(
+            tool, tool_call, signal, stream, parent_task, before_tool_call
+        )
+    async with limit:
+        return await _execute_single_tool(
+            tool, tool_call, signal, stream, parent_task, before_tool_call
+        )
+
+
 async def execute_tool_calls(
     tools: list[AgentTool] | None,
     assistant_message: AssistantMessage,
@@ -267,7 +292,9 @@ async def execute_tool_calls(
     get_steering_messages: Callable[[], Awaitable[list[AgentMessage]]] | None = None,
     before_tool_call: BeforeToolCallFn | None = None,
     after_tool_call: AfterToolCallFn | None = None,
+    max_parallel_tools: int | None = None,
 ) -> ToolExecutionResult:
+    limit = _resolve_parallel_limit(max_parallel_tools)
     tool_calls = _extract_tool_calls(assistant_message)
     if not tool_calls:
         return ToolExecutionResult()
@@ -282,12 +309,14 @@ async def execute_tool_calls(
             )
         )
 
-    # Resolve tools and execute all in parallel
+    # Resolve tools and execute all in parallel, optionally bounded by max_parallel_tools
     resolved = [_find_tool(tools, tc.name or "") for tc in tool_calls]
     parent_task = asyncio.current_task()
     raw_results: list[tuple[AgentToolResult, bool, bool]] = await asyncio.gather(
         *(
-            _execute_single_tool(tool, tc, signal, stream, parent_task, before_tool_call)
+            _execute_single_tool_bounded(
+                limit, tool, tc, signal, stream, parent_task, before_tool_call
+            )
             for tool, tc in zip(resolved, tool_calls, strict=True)
         )
     )
@@ -503,6 +503,17 @@ def is_tool_execution_event(event: AgentEvent) -> TypeGuard[ToolExecutionEvent]:
     )
 
 
+def validate_max_parallel_tools(max_parallel_tools: int | None) -> None:
+    """Reject a tool concurrency limit that is not None or a positive int."""
+
+    if max_parallel_tools is None:
+        return
+    if isinstance(max_parallel_tools, bool) or not isinstance(max_parallel_tools, int):
+        raise TypeError("max_parallel_tools: expected int or None")
+    if max_parallel_tools < 1:
+        raise ValueError("max_parallel_tools must be >= 1")
+
+
 @dataclass
 class AgentLoopConfig:
     """Configuration for the agent loop."""
@@ -516,10 +527,14 @@ class AgentLoopConfig:
     before_tool_call: BeforeToolCallFn | None = None
     after_tool_call: AfterToolCallFn | None = None
     should_stop_after_turn: ShouldStopAfterTurnFn | None = None
+    max_parallel_tools: int | None = None
     api_key: str | None = None
     temperature: float | None = None
     max_tokens: int | None = None
 
+    def __post_init__(self) -> None:
+        validate_max_parallel_tools(self.max_parallel_tools)
+
 
 class AgentState(_AgentBaseModel):
     """Agent state containing all configuration and conversation data."""
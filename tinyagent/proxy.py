@@ -40,6 +40,8 @@ class ProxyStreamOptions:
     max_tokens: int | None = None
     reasoning: JsonValue | None = None
     signal: Callable[[], bool] | None = None  # cancellation check function
+    # Caller-owned client reused across requests for connection pooling; never closed here.
+    client: httpx.AsyncClient | None = None
 
 
 def _create_initial_partial(model: Model) -> AssistantMessage:
@@ -221,27 +223,33 @@ class ProxyStreamResponse(StreamResponse):
                 continue
             await self._queue_event(event)
 
+    async def _post_stream_request(self, client: httpx.AsyncClient) -> None:
+        request_body = _build_proxy_request_body(self._model, self._context, self._options)
+
+        async with client.stream(
+            "POST",
+            f"{self._options.proxy_url}/api/stream",
+            headers={
+                "Authorization": f"Bearer {self._options.auth_token}",
+                "Content-Type": "application/json",
+            },
+            json=request_body,
+            timeout=None,
+        ) as response:
+            if response.status_code != 200:
+                raise RuntimeError(_build_proxy_error_message(response))
+
+            await self._stream_from_http_response(response)
+
     async def _run_success(self) -> None:
         if self._is_aborted():
             raise RuntimeError("Request aborted by user")
 
-        request_body = _build_proxy_request_body(self._model, self._context, self._options)
-
-        async with httpx.AsyncClient() as client:
-            async with client.stream(
-                "POST",
-                f"{self._options.proxy_url}/api/stream",
-                headers={
-                    "Authorization": f"Bearer {self._options.auth_token}",
-                    "Content-Type": "application/json",
-                },
-                json=request_body,
-                timeout=None,
-            ) as response:
-                if response.status_code != 200:
-                    raise RuntimeError(_build_proxy_error_message(response))
-
-                await self._stream_from_http_response(response)
+        if self._options.client is not None:
+            await self._post_stream_request(self._options.client)
+        else:
+            async with httpx.AsyncClient() as client:
+                await self._post_stream_request(client)
 
         if self._final is None:
             self._final = self._partial
@@ -287,6 +295,7 @@ async def create_proxy_stream(
     max_tokens: int | None = None,
     reasoning: JsonValue | None = None,
     signal: Callable[[], bool] | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> ProxyStreamResponse:
     """Convenience helper to create a proxy stream."""
 
@@ -297,6 +306,7 @@ async def create_proxy_stream(
         max_tokens=max_tokens,
         reasoning=reasoning,
         signal=signal,
+        client=client,
     )
     return await stream_proxy(model, context, options)
 